@@ -1,15 +1,17 @@
 """OddsScraper is a simple web scraper for NFL odds."""
 
+import asyncio
 import configparser
-import re
+import itertools
+import queue
 import sys
 import threading
-from datetime import datetime
-from io import StringIO
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 from pathlib import Path
 
+import httpx
 import pandas as pd
-from bs4 import BeautifulSoup
 from PyQt6 import QtCore, QtWidgets
 from PyQt6.QtCore import QThread, pyqtSignal
 from selenium import webdriver
@@ -21,6 +23,15 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 from odds_scraper.utils.logger import log
+from odds_scraper.utils.parser import parse_odds
+from odds_scraper.utils.season import MAX_WEEK, current_nfl_week, nfl_season_year, week_end
+from odds_scraper.utils.workbook import (
+    WORKBOOK_ERRORS,
+    read_workbook,
+    scraped_on,
+    with_scrape_date,
+    write_workbook,
+)
 
 config = configparser.ConfigParser()
 config.read("config.ini")
@@ -28,78 +39,247 @@ config.read("config.ini")
 WEB_URL = config["DEFAULT"]["WebUrl"]
 TIMEOUT = int(config["DEFAULT"]["Timeout"])
 OUTPUT_PATH = Path(config["DEFAULT"]["OutputPath"])
+PROFILE_PATH = Path(
+    config["DEFAULT"].get("ProfilePath", fallback=str(Path.home() / ".nfl_scraper_profile"))
+)
 
 WINDOW_WIDTH = 300
 WINDOW_HEIGHT = 200
-LOCAL_THREAD = threading.local()
+STATUS_INTERVAL = 100  # Milliseconds between status text updates
+MAX_CONCURRENCY = config["DEFAULT"].getint("MaxConcurrency", fallback=4)
+POLL_FREQUENCY = 0.1
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/58.0.3029.110 Safari/537.3"
+)
+DRIVER_POOL = queue.Queue()
+DRIVER_PROFILES = {}
+PROFILES_IN_USE = set()
+PROFILE_LOCK = threading.Lock()
+
+
+def create_webdriver(profile_id):
+    """Creates a new headless Firefox web driver using the given persistent profile."""
+    options = FirefoxOptions()
+    service = FirefoxService()
+    options.add_argument("--headless")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--no-sandbox")
+    options.page_load_strategy = "eager"  # Return once the DOM is ready
+    # Each concurrent driver keeps its own persistent profile, so cookies survive between runs
+    profile_dir = PROFILE_PATH / f"driver{profile_id}"
+    profile_dir.mkdir(exist_ok=True, parents=True)
+    options.add_argument("-profile")
+    options.add_argument(str(profile_dir))
+    options.set_preference("permissions.default.image", 2)  # Disable images
+    options.set_preference("permissions.default.stylesheet", 2)  # Disable CSS
+    options.set_preference("gfx.downloadable_fonts.enabled", False)  # Disable web fonts
+    options.set_preference("media.autoplay.default", 5)  # Block audio/video autoplay
+    options.set_preference("privacy.trackingprotection.enabled", True)  # Block trackers
+    options.set_preference("privacy.trackingprotection.socialtracking.enabled", True)
+    options.set_preference("general.useragent.override", USER_AGENT)
+    driver = webdriver.Firefox(service=service, options=options)
+    driver.set_page_load_timeout(TIMEOUT)
+    return driver
+
+
+def get_webdriver():
+    """Takes an idle web driver from the pool, starting a new one if none is free."""
+    try:
+        return DRIVER_POOL.get_nowait()
+    except queue.Empty:
+        pass
+
+    with PROFILE_LOCK:
+        profile_id = next(i for i in itertools.count() if i not in PROFILES_IN_USE)
+        PROFILES_IN_USE.add(profile_id)
+    try:
+        driver = create_webdriver(profile_id)
+    except Exception:
+        with PROFILE_LOCK:
+            PROFILES_IN_USE.discard(profile_id)
+        raise
+    with PROFILE_LOCK:
+        DRIVER_PROFILES[driver] = profile_id
+    return driver
+
+
+def release_webdriver(driver):
+    """Returns a web driver to the pool for reuse."""
+    DRIVER_POOL.put(driver)
+
+
+def discard_webdriver(driver):
+    """Shuts down a web driver that may be broken instead of returning it to the pool."""
+    try:
+        driver.quit()
+    except WebDriverException as error:
+        log.warning("Failed to shut down web driver: %s", error)
+    # Free the profile only once Firefox has released its lock on it
+    with PROFILE_LOCK:
+        PROFILES_IN_USE.discard(DRIVER_PROFILES.pop(driver, None))
+
+
+def stop_webdriver():
+    """Shuts down every pooled web driver."""
+    while True:
+        try:
+            driver = DRIVER_POOL.get_nowait()
+        except queue.Empty:
+            break
+        discard_webdriver(driver)
 
 
 class ScraperWorker(QThread):
     """Worker thread for scraping NFL odds."""
 
     finished = pyqtSignal()
-    progress = pyqtSignal(str)
     error = pyqtSignal(str)
 
-    def __init__(self, start_week, end_week, driver):
+    def __init__(self, start_week, end_week):
         super().__init__()
         self.start_week = start_week
         self.end_week = end_week
-        self.driver = driver
         self.scraping_active = True
+        self.messages = queue.Queue()
+        self.season_year = nfl_season_year(date.today())
+        self.output_file = OUTPUT_PATH / f"{self.season_year - 2000:02}.xlsx"
 
     def run(self):
         """Scrapes NFL odds for the specified weeks."""
         try:
-            for week in range(self.start_week, self.end_week + 1):
-                if not self.scraping_active:
-                    self.progress.emit("Scraping stopped by user.")
-                    break
-                self.driver.get(f"{WEB_URL}-{week}")
-                WebDriverWait(self.driver, TIMEOUT).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "table"))
-                )
-                soup = BeautifulSoup(self.driver.page_source, "lxml")
-                tables = soup.find_all("table")
-
-                dataframes = []
-                for table in tables:
-                    table_data = pd.read_html(StringIO(str(table)))[0]
-                    table_data.columns = ["Matchup"] + list(table_data.columns[1:])
-                    dataframes.append(table_data)
-
-                all_odds = pd.concat(dataframes, ignore_index=True)
-                all_odds["Matchup"] = all_odds["Matchup"].apply(
-                    lambda x: re.sub(r"^\d{1,2}:\d{2}[AP]M\w{2,3}\s*", "", x)
-                )
-                all_odds["Spread"] = all_odds["Spread"].apply(
-                    lambda x: (
-                        re.search(r"[-+]?\d+(\.\d+)?", x).group()
-                        if re.search(r"[-+]?\d+(\.\d+)?", x)
-                        else x
-                    )
-                )
-                all_odds["Total"] = all_odds["Total"].apply(
-                    lambda x: (
-                        re.search(r"\d+(\.\d+)?", x).group() if re.search(r"\d+(\.\d+)?", x) else x
-                    )
-                )
-                all_odds["Moneyline"] = all_odds["Moneyline"].apply(lambda x: x.replace("−", "-"))
-                all_odds["Spread"] = pd.to_numeric(all_odds["Spread"])
-                all_odds["Total"] = pd.to_numeric(all_odds["Total"])
-                all_odds["Moneyline"] = pd.to_numeric(all_odds["Moneyline"])
-
-                current_year = datetime.now().year
-                output_file = Path(f"{OUTPUT_PATH}/{current_year-2000:02}{week:02}.xlsx")
-                output_file.parent.mkdir(exist_ok=True, parents=True)
-                with pd.ExcelWriter(output_file) as writer:
-                    all_odds.to_excel(writer, index=False)
-                self.progress.emit(f"Week {week} data scraped successfully.")
-        except (ValueError, WebDriverException) as error:
-            self.error.emit(f"An error occurred: {error}")
+            asyncio.run(self.scrape_weeks())
         finally:
             self.finished.emit()
 
+    async def scrape_weeks(self):
+        """Scrapes the specified weeks concurrently, using a browser only where required."""
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+        try:
+            OUTPUT_PATH.mkdir(exist_ok=True, parents=True)
+            weeks = self.weeks_to_scrape()
+        except WORKBOOK_ERRORS as error:
+            self.error.emit(f"Could not read {self.output_file}: {error}")
+            return
+        pages = await self.fetch_pages(weeks)
+
+        async def scrape(week):
+            async with semaphore:
+                if not self.scraping_active:
+                    return None
+                if week in pages:
+                    try:
+                        return await loop.run_in_executor(
+                            executor, self.parse_week, week, pages[week]
+                        )
+                    except ValueError as error:
+                        log.info("Week %s page unusable, falling back to browser: %s", week, error)
+                driver = await loop.run_in_executor(executor, get_webdriver)
+                try:
+                    page_source = await loop.run_in_executor(
+                        executor, self.render_week, week, driver
+                    )
+                except Exception:
+                    await loop.run_in_executor(executor, discard_webdriver, driver)
+                    raise
+                release_webdriver(driver)
+                return await loop.run_in_executor(executor, self.parse_week, week, page_source)
+
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENCY) as executor:
+            results = await asyncio.gather(
+                *(scrape(week) for week in weeks), return_exceptions=True
+            )
+            odds_by_week = {
+                week: result
+                for week, result in zip(weeks, results)
+                if isinstance(result, pd.DataFrame)
+            }
+            if odds_by_week:
+                try:
+                    await loop.run_in_executor(executor, self.save_weeks, odds_by_week)
+                except WORKBOOK_ERRORS as error:
+                    self.error.emit(f"Could not save {self.output_file}: {error}")
+
+        if not self.scraping_active:
+            self.messages.put_nowait("Scraping stopped by user.")
+        for week, result in zip(weeks, results):
+            if isinstance(result, (ValueError, WebDriverException)):
+                self.error.emit(f"An error occurred in week {week}: {result}")
+            elif isinstance(result, BaseException):
+                raise result
+
+    def weeks_to_scrape(self):
+        """Returns the requested weeks, minus weeks saved after they were already final."""
+        weeks = range(self.start_week, self.end_week + 1)
+        saved_sheets = read_workbook(self.output_file)
+        current_week = current_nfl_week(date.today())
+        pending = []
+        for week in weeks:
+            sheet = saved_sheets.get(f"Week {week:02}")
+            # Lines keep moving until the week is over, so only a scrape after that is final
+            scraped = None if sheet is None else scraped_on(sheet)
+            if week < current_week and scraped and scraped > week_end(self.season_year, week):
+                self.messages.put_nowait(f"Week {week} is final and already saved, skipping.")
+            else:
+                pending.append(week)
+        return pending
+
+    async def fetch_pages(self, weeks):
+        """Fetches the weekly odds pages over plain HTTP, skipping any that need a browser."""
+        async with httpx.AsyncClient(
+            http2=True,
+            headers={"User-Agent": USER_AGENT},
+            timeout=TIMEOUT,
+            follow_redirects=True,
+        ) as client:
+            responses = await asyncio.gather(
+                *(client.get(f"{WEB_URL}-{week}") for week in weeks), return_exceptions=True
+            )
+
+        pages = {}
+        for week, response in zip(weeks, responses):
+            if isinstance(response, httpx.HTTPError):
+                log.info("Week %s fetch failed, falling back to browser: %s", week, response)
+            elif isinstance(response, BaseException):
+                raise response
+            elif response.is_error or b"<table" not in response.content:
+                log.info("Week %s needs a browser (status %s)", week, response.status_code)
+            else:
+                pages[week] = response.text
+        return pages
+
+    def render_week(self, week, driver):
+        """Renders the odds page for a single week and returns the HTML of its tables."""
+        driver.get(f"{WEB_URL}-{week}")
+        WebDriverWait(driver, TIMEOUT, poll_frequency=POLL_FREQUENCY).until(
+            EC.presence_of_element_located((By.TAG_NAME, "table"))
+        )
+        tables_html = driver.execute_script(
+            "return Array.from(document.querySelectorAll('table')).map(t => t.outerHTML);"
+        )
+        return "".join(tables_html)
+
+    def parse_week(self, week, page_source):
+        """Parses the odds tables for a single week into one cleaned-up DataFrame."""
+        all_odds = parse_odds(page_source)
+        self.messages.put_nowait(f"Week {week} data scraped successfully.")
+        return all_odds
+
+    def save_weeks(self, odds_by_week):
+        """Writes each week to its own sheet of the season workbook, keeping earlier weeks."""
+        sheets = read_workbook(self.output_file)
+        today = date.today()
+        sheets.update(
+            {
+                f"Week {week:02}": with_scrape_date(odds, today)
+                for week, odds in odds_by_week.items()
+            }
+        )
+        write_workbook(self.output_file, sheets)
+
     def stop(self):
         """Stops the scraping process."""
         self.scraping_active = False
@@ -113,9 +293,8 @@ class OddsScraperWindow(QtWidgets.QMainWindow):
         super().__init__()
         self.setWindowTitle("NFL Odds Scraper")
         self.setFixedSize(WINDOW_WIDTH, WINDOW_HEIGHT)
-        self.general_layout = QtWidgets.QVBoxLayout()
         central_widget = QtWidgets.QWidget(self)
-        central_widget.setLayout(self.general_layout)
+        central_widget.setLayout(QtWidgets.QVBoxLayout())
         self.setCentralWidget(central_widget)
         self.create_interface()
         self.worker = None
@@ -130,6 +309,10 @@ class OddsScraperWindow(QtWidgets.QMainWindow):
         end_week_label = QtWidgets.QLabel("End Week:")
         self.status_text = QtWidgets.QLabel("Ready")
 
+        self.status_timer = QtCore.QTimer(self)
+        self.status_timer.setInterval(STATUS_INTERVAL)
+        self.status_timer.timeout.connect(self.on_progress)
+
         self.start_button = QtWidgets.QPushButton("Start")
         self.start_button.setAutoDefault(True)
         self.start_button.clicked.connect(self.start_scraping)
@@ -158,28 +341,26 @@ class OddsScraperWindow(QtWidgets.QMainWindow):
         grid_layout.addWidget(self.stop_button, 3, 2)
         grid_layout.addWidget(self.status_text, 4, 0, 1, 3)
 
-        self.general_layout.addLayout(grid_layout)
+        self.centralWidget().layout().addLayout(grid_layout)
 
     def start_scraping(self):
         """Starts the scraping process in a separate thread."""
         self.start_button.setEnabled(False)
         self.status_text.setText("Running...")
-        self.status_text.repaint()
 
         if not self.validate_inputs():
             self.start_button.setEnabled(True)
             return
 
         try:
-            driver = self.get_webdriver()
             start_week = int(self.start_week_edit.text())
             end_week = int(self.end_week_edit.text())
 
-            self.worker = ScraperWorker(start_week, end_week, driver)
+            self.worker = ScraperWorker(start_week, end_week)
             self.worker.finished.connect(self.on_finished)
-            self.worker.progress.connect(self.on_progress)
             self.worker.error.connect(self.on_error)
             self.worker.start()
+            self.status_timer.start()
             self.stop_button.setEnabled(True)
         except (ValueError, WebDriverException) as error:
             log.error("An error occurred: %s", error)
@@ -192,24 +373,28 @@ class OddsScraperWindow(QtWidgets.QMainWindow):
             self.worker.stop()
             self.stop_button.setEnabled(False)
             self.status_text.setText("Stopping...")
-            self.status_text.repaint()
 
     def on_finished(self):
         """Handles the completion of the scraping process."""
         self.start_button.setEnabled(True)
         self.stop_button.setEnabled(False)
+        self.status_timer.stop()
         self.status_text.setText("Done!")
-        self.status_text.repaint()
 
-    def on_progress(self, message):
-        """Updates the status text with progress messages."""
-        self.status_text.setText(message)
-        self.status_text.repaint()
+    def on_progress(self):
+        """Updates the status text with the latest queued progress message."""
+        message = None
+        while True:
+            try:
+                message = self.worker.messages.get_nowait()
+            except queue.Empty:
+                break
+        if message is not None:
+            self.status_text.setText(message)
 
     def on_error(self, message):
         """Handles errors during the scraping process."""
         self.status_text.setText(message)
-        self.status_text.repaint()
 
     def validate_inputs(self):
         """Validates the start week and end week inputs."""
@@ -217,10 +402,10 @@ class OddsScraperWindow(QtWidgets.QMainWindow):
         def validate_week(week_str, label):
             try:
                 week = int(week_str)
-                if week < 1 or week > 18:
-                    return f"{label} must be between 1 and 18."
+                if week < 1 or week > MAX_WEEK:
+                    return f"{label} must be between 1 and {MAX_WEEK}."
             except ValueError:
-                return f"{label} must be a number between 1 and 18."
+                return f"{label} must be a number between 1 and {MAX_WEEK}."
             return None
 
         start_week_error = validate_week(self.start_week_edit.text(), "Start week")
@@ -239,35 +424,11 @@ class OddsScraperWindow(QtWidgets.QMainWindow):
 
         return True
 
-    def get_webdriver(self):
-        """Initializes selenium web scraper."""
-        driver = getattr(LOCAL_THREAD, "driver", None)
-        if driver is None:
-            options = FirefoxOptions()
-            service = FirefoxService()
-            options.add_argument("--headless")
-            options.add_argument("--disable-gpu")
-            options.add_argument("--disable-extensions")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--no-sandbox")
-            options.set_preference("permissions.default.image", 2)  # Disable images
-            options.set_preference("permissions.default.stylesheet", 2)  # Disable CSS
-            options.set_preference(
-                "general.useragent.override",
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/58.0.3029.110 Safari/537.3",
-            )
-            driver = webdriver.Firefox(service=service, options=options)
-            driver.set_page_load_timeout(TIMEOUT)
-            driver.implicitly_wait(TIMEOUT)
-            LOCAL_THREAD.driver = driver
-        return driver
-
-    def stop_webdriver(self, driver):
-        """Shuts down selenium web scraper."""
-        if driver:
-            driver.quit()
-            LOCAL_THREAD.driver = None
+    def shutdown(self):
+        """Stops any running scrape and waits for it to finish."""
+        if self.worker:
+            self.worker.stop()
+            self.worker.wait()
 
 
 def main():
@@ -275,7 +436,8 @@ def main():
     app = QtWidgets.QApplication([])
     window = OddsScraperWindow()
     window.show()
-    app.aboutToQuit.connect(lambda: window.stop_webdriver(getattr(LOCAL_THREAD, "driver", None)))
+    app.aboutToQuit.connect(window.shutdown)
+    app.aboutToQuit.connect(stop_webdriver)
     sys.exit(app.exec())
 
 
@@ -1,12 +1,16 @@
 """Implements a formatted logger for the application."""
 
 import logging
+import os
 from logging.config import dictConfig
 
+# Log level for the application, e.g. LOG_LEVEL=DEBUG for verbose output
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
+
 # Configure the logging format and handler
 LOGGING_CONFIG = {
     "version": 1,
-    "disable_existing_loggers": True,
+    "disable_existing_loggers": False,
     "formatters": {
         "default": {
             "format": (
@@ -28,9 +32,15 @@ LOGGING_CONFIG = {
     "loggers": {
         "root": {
             "handlers": ["default"],
-            "level": "DEBUG",
+            "level": LOG_LEVEL,
             "propagate": False,
         },
+        # Keep chatty third-party libraries quiet regardless of the application level
+        "selenium": {"level": "WARNING"},
+        "urllib3": {"level": "WARNING"},
+        "httpx": {"level": "WARNING"},
+        "httpcore": {"level": "WARNING"},
+        "hpack": {"level": "WARNING"},
     },
 }
 
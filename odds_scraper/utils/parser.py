@@ -0,0 +1,63 @@
+"""Parses scraped odds tables into a single cleaned-up DataFrame."""
+
+from io import StringIO
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+TIME_PATTERN = r"^\d{1,2}:\d{2}[AP]M\w{2,3}\s*"
+SPREAD_PATTERN = r"(?P<number>[-+]?\d+(?:\.\d+)?)"
+TOTAL_PATTERN = r"(?P<number>\d+(?:\.\d+)?)"
+ODDS_COLUMNS = ["Spread", "Total", "Moneyline"]
+
+
+def strip_pattern(column, pattern):
+    """Removes the first match of pattern from each cell in one native pass."""
+    stripped = pc.replace_substring_regex(
+        pa.array(column, type=pa.string(), from_pandas=True), pattern, "", max_replacements=1
+    )
+    return stripped.to_pandas().set_axis(column.index)
+
+
+def extract_number(column, pattern):
+    """Extracts the first number matching pattern from each cell in one native pass."""
+    matches = pc.extract_regex(pa.array(column, type=pa.string(), from_pandas=True), pattern)
+    numbers = pc.cast(pc.struct_field(matches, "number"), pa.float64())
+    return pd.Series(numbers.to_numpy(zero_copy_only=False), index=column.index)
+
+
+def as_text(table):
+    """Returns the cells of table as strings, keeping empty cells as None."""
+    return np.where(table.isna(), None, table.to_numpy(dtype=str))
+
+
+def parse_odds(page_source):
+    """Parses every odds table in page_source into one DataFrame."""
+    tables = pd.read_html(StringIO(page_source), flavor="lxml")
+    headers = [list(table.columns[1:]) for table in tables]
+    if all(header == headers[0] for header in headers):
+        rows = np.concatenate([as_text(table) for table in tables])
+        columns = ["Matchup"] + headers[0]
+    else:
+        # Layouts differ, so let pandas line the columns up by name
+        combined = pd.concat(
+            [
+                table.set_axis(["Matchup"] + header, axis=1)
+                for table, header in zip(tables, headers)
+            ],
+            ignore_index=True,
+        )
+        rows = as_text(combined)
+        columns = combined.columns
+    all_odds = pd.DataFrame(rows, columns=columns)
+    missing = [column for column in ODDS_COLUMNS if column not in all_odds.columns]
+    if missing:
+        raise ValueError(f"No odds table found, missing columns: {', '.join(missing)}")
+
+    all_odds["Matchup"] = strip_pattern(all_odds["Matchup"], TIME_PATTERN)
+    all_odds["Spread"] = extract_number(all_odds["Spread"], SPREAD_PATTERN)
+    all_odds["Total"] = extract_number(all_odds["Total"], TOTAL_PATTERN)
+    all_odds["Moneyline"] = pd.to_numeric(all_odds["Moneyline"].str.replace("−", "-", regex=False))
+    return all_odds
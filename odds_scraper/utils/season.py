@@ -0,0 +1,32 @@
+"""Works out where a date falls in the NFL regular season."""
+
+from datetime import date, timedelta
+
+MAX_WEEK = 18
+
+
+def nfl_season_year(today):
+    """Returns the year the NFL season in progress on today started in."""
+    # January and February still belong to the season that kicked off the previous September
+    return today.year if today.month >= 3 else today.year - 1
+
+
+def week_one_start(season_year):
+    """Returns the Tuesday that week 1 of the given season starts on."""
+    september_first = date(season_year, 9, 1)
+    labor_day = september_first + timedelta(days=(7 - september_first.weekday()) % 7)
+    # Weeks run Tuesday through Monday, starting the day after Labor Day
+    return labor_day + timedelta(days=1)
+
+
+def week_end(season_year, week):
+    """Returns the Monday the given week of the season ends on."""
+    return week_one_start(season_year) + timedelta(days=7 * week - 1)
+
+
+def current_nfl_week(today):
+    """Returns the regular-season week in progress on today; every earlier week is final."""
+    week_one = week_one_start(nfl_season_year(today))
+    if today < week_one:
+        return 1
+    return min((today - week_one).days // 7 + 1, MAX_WEEK + 1)
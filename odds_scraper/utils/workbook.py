@@ -0,0 +1,37 @@
+"""Reads and writes the season workbook of weekly odds sheets."""
+
+import zipfile
+
+import pandas as pd
+
+# Raised when the workbook is locked (e.g. open in Excel), missing a directory or corrupt
+WORKBOOK_ERRORS = (OSError, ValueError, zipfile.BadZipFile)
+# Records the day each weekly sheet was scraped on
+SCRAPED_COLUMN = "Scraped"
+
+
+def read_workbook(path):
+    """Reads every sheet of the workbook at path, or nothing if it does not exist yet."""
+    if not path.exists():
+        return {}
+    return pd.read_excel(path, sheet_name=None)
+
+
+def write_workbook(path, sheets):
+    """Writes each DataFrame in sheets to its own sheet, in sheet name order."""
+    with pd.ExcelWriter(path, engine="xlsxwriter") as writer:
+        for sheet_name in sorted(sheets):
+            sheets[sheet_name].to_excel(writer, sheet_name=sheet_name, index=False)
+
+
+def with_scrape_date(odds, day):
+    """Returns a copy of a weekly odds sheet recording that it was scraped on day."""
+    return odds.assign(**{SCRAPED_COLUMN: day})
+
+
+def scraped_on(sheet):
+    """Returns the day sheet was scraped on, or None for sheets saved without a scrape date."""
+    if SCRAPED_COLUMN not in sheet:
+        return None
+    scraped = pd.to_datetime(sheet[SCRAPED_COLUMN]).min()
+    return None if pd.isna(scraped) else scraped.date()
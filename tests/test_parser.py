@@ -0,0 +1,65 @@
+"""Tests for the odds table parser."""
+
+import pandas as pd
+import pytest
+
+from odds_scraper.utils.parser import parse_odds
+
+HEADER = "<tr><th>{day}</th><th>Spread</th><th>Total</th><th>Moneyline</th></tr>"
+
+
+def make_table(day, *rows, header=HEADER):
+    """Builds an odds table from rows of cell text."""
+    cells = "".join("<tr>" + "".join(f"<td>{cell}</td>" for cell in row) + "</tr>" for row in rows)
+    return f"<table>{header.format(day=day)}{cells}</table>"
+
+
+def test_parse_odds_cleans_columns():
+    """Kickoff times are stripped and odds become numbers."""
+    page = make_table("Thu", ("8:15PMEST Bills @ Jets", "-3.5-110", "o47.5-110", "−170")) + (
+        make_table("Sun", ("Bears @ Lions", "+7 -105", "u41", "+250"))
+    )
+
+    odds = parse_odds(page)
+
+    assert odds["Matchup"].tolist() == ["Bills @ Jets", "Bears @ Lions"]
+    assert odds["Spread"].tolist() == [-3.5, 7.0]
+    assert odds["Total"].tolist() == [47.5, 41.0]
+    assert odds["Moneyline"].tolist() == [-170, 250]
+
+
+def test_parse_odds_blank_cells():
+    """Empty cells stay missing instead of becoming the text "nan"."""
+    page = make_table("Thu", ("Bills @ Jets", "-3.5-110", "o47.5", "−170")) + (
+        make_table("Sun", ("", "+7 -105", "u41", ""))
+    )
+
+    odds = parse_odds(page)
+
+    assert odds["Matchup"].tolist()[0] == "Bills @ Jets"
+    assert pd.isna(odds["Matchup"].iloc[1])
+    assert odds["Moneyline"].iloc[0] == -170
+    assert pd.isna(odds["Moneyline"].iloc[1])
+
+
+def test_parse_odds_mixed_layouts():
+    """Tables with reordered columns are aligned by header, blanks included."""
+    reordered = "<tr><th>{day}</th><th>Moneyline</th><th>Spread</th><th>Total</th></tr>"
+    page = make_table("Thu", ("Bills @ Jets", "-3.5-110", "o47.5", "−170")) + make_table(
+        "Sun", ("Bears @ Lions", "", "+7 -105", "u41"), header=reordered
+    )
+
+    odds = parse_odds(page)
+
+    assert odds["Spread"].tolist() == [-3.5, 7.0]
+    assert odds["Total"].tolist() == [47.5, 41.0]
+    assert odds["Moneyline"].iloc[0] == -170
+    assert pd.isna(odds["Moneyline"].iloc[1])
+
+
+def test_parse_odds_without_odds():
+    """A page whose tables hold no odds is rejected rather than half-parsed."""
+    page = "<table><tr><th>Team</th><th>Record</th></tr><tr><td>Bills</td><td>3-1</td></tr></table>"
+
+    with pytest.raises(ValueError, match="Spread, Total, Moneyline"):
+        parse_odds(page)
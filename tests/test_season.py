@@ -0,0 +1,50 @@
+"""Tests for the NFL season calendar helpers."""
+
+from datetime import date
+
+from odds_scraper.utils.season import (
+    MAX_WEEK,
+    current_nfl_week,
+    nfl_season_year,
+    week_end,
+)
+
+
+def test_season_year_in_autumn():
+    """A date from March onwards belongs to the season starting that year."""
+    assert nfl_season_year(date(2026, 3, 1)) == 2026
+    assert nfl_season_year(date(2026, 10, 15)) == 2026
+
+
+def test_season_year_in_winter():
+    """January and February belong to the season that started the year before."""
+    assert nfl_season_year(date(2027, 1, 10)) == 2026
+    assert nfl_season_year(date(2027, 2, 28)) == 2026
+
+
+def test_week_before_kickoff():
+    """Every day before week 1 starts counts as week 1."""
+    assert current_nfl_week(date(2026, 6, 1)) == 1
+    # Labor Day 2026 is Monday, September 7
+    assert current_nfl_week(date(2026, 9, 7)) == 1
+
+
+def test_week_boundaries():
+    """Weeks run Tuesday through Monday, starting the day after Labor Day."""
+    assert current_nfl_week(date(2026, 9, 8)) == 1
+    assert current_nfl_week(date(2026, 9, 14)) == 1
+    assert current_nfl_week(date(2026, 9, 15)) == 2
+    assert current_nfl_week(date(2026, 10, 15)) == 6
+
+
+def test_week_after_season():
+    """Once the regular season is over, every week is final."""
+    assert current_nfl_week(date(2027, 1, 20)) == MAX_WEEK + 1
+    assert current_nfl_week(date(2027, 2, 28)) == MAX_WEEK + 1
+
+
+def test_week_end():
+    """Each week ends on the Monday six days after it starts."""
+    assert week_end(2026, 1) == date(2026, 9, 14)
+    assert week_end(2026, 6) == date(2026, 10, 19)
+    assert week_end(2025, 1) == date(2025, 9, 8)
@@ -0,0 +1,64 @@
+"""Tests for the season workbook helpers."""
+
+from datetime import date
+
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from odds_scraper.utils.workbook import (
+    SCRAPED_COLUMN,
+    WORKBOOK_ERRORS,
+    read_workbook,
+    scraped_on,
+    write_workbook,
+)
+
+
+def test_write_round_trip(tmp_path):
+    """Every cell written to the workbook reads back unchanged."""
+    odds = pd.DataFrame(
+        {
+            "Matchup": ["Bills @ Jets", "Bears @ Lions", "Rams @ 49ers"],
+            "Spread": [-3.5, 7.0, 1.5],
+            "Total": [47.5, 41.0, 44.5],
+            "Moneyline": [-170, 250, -110],
+        }
+    )
+    path = tmp_path / "26.xlsx"
+
+    write_workbook(path, {"Week 02": odds, "Week 01": odds.iloc[::-1]})
+    sheets = read_workbook(path)
+
+    assert list(sheets) == ["Week 01", "Week 02"]
+    assert_frame_equal(sheets["Week 02"], odds)
+    assert_frame_equal(sheets["Week 01"], odds.iloc[::-1].reset_index(drop=True))
+
+
+def test_read_missing_file(tmp_path):
+    """A workbook that does not exist yet has no sheets."""
+    assert not read_workbook(tmp_path / "26.xlsx")
+
+
+def test_read_corrupt_workbook(tmp_path):
+    """A corrupt workbook fails with one of the errors the worker reports."""
+    path = tmp_path / "26.xlsx"
+    path.write_bytes(b"not a zip file")
+
+    with pytest.raises(WORKBOOK_ERRORS):
+        read_workbook(path)
+
+
+def test_scraped_on_round_trip(tmp_path):
+    """The scrape date saved with a sheet reads back as the same day."""
+    odds = pd.DataFrame({"Matchup": ["Bills @ Jets"], SCRAPED_COLUMN: [date(2026, 10, 15)]})
+    path = tmp_path / "26.xlsx"
+
+    write_workbook(path, {"Week 06": odds})
+
+    assert scraped_on(read_workbook(path)["Week 06"]) == date(2026, 10, 15)
+
+
+def test_scraped_on_missing_column():
+    """A sheet saved without a scrape date has no known scrape day."""
+    assert scraped_on(pd.DataFrame({"Matchup": ["Bills @ Jets"]})) is None